@@ -15,8 +15,15 @@ class PlayerAdmin(admin.ModelAdmin):
 class ProfileSnapshotAdmin(admin.ModelAdmin):
     list_display = ['player', 'skill_fishing_level', 'hypixel_profile_id', 'created_at']
     list_filter = ['skill_fishing_level', 'created_at']
+    list_select_related = ['player']
+    show_full_result_count = False
+    list_per_page = 50
+    list_max_show_all = 200
     search_fields = ['player__ign', 'hypixel_profile_id']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).without_raw_json()
+
 
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
@@ -28,7 +35,7 @@ class ItemAdmin(admin.ModelAdmin):
 @admin.register(GearSet)
 class GearSetAdmin(admin.ModelAdmin):
     list_display = ['name', 'active', 'created_at']
-    filter_horizontal = ['pieces']
+    autocomplete_fields = ['pieces']
     search_fields = ['name']
 
 
@@ -47,8 +54,12 @@ class MethodAdmin(admin.ModelAdmin):
 
 @admin.register(Recommendation)
 class RecommendationAdmin(admin.ModelAdmin):
-    list_display = ['snapshot', 'score', 'version', 'created_at']
+    list_display = ['player_ign', 'snapshot_fishing_level', 'score', 'version', 'created_at']
     list_filter = ['version', 'created_at']
+    search_fields = ['player_ign']
+    show_full_result_count = False
+    list_per_page = 50
+    list_max_show_all = 200
 
 
 @admin.register(DataVersion)
@@ -61,3 +72,7 @@ class DataVersionAdmin(admin.ModelAdmin):
 class BazaarPriceAdmin(admin.ModelAdmin):
     list_display = ['item', 'price', 'source_ts', 'created_at']
     list_filter = ['source_ts']
+    list_select_related = ['item']
+    show_full_result_count = False
+    list_per_page = 50
+    list_max_show_all = 200
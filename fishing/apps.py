@@ -1,6 +1,12 @@
+import atexit
+
 from django.apps import AppConfig
 
 
 class FishingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'fishing'
+
+    def ready(self):
+        from .hypixel_api import close_shared_clients
+        atexit.register(close_shared_clients)
@@ -2,7 +2,23 @@
 Fishing calculators for Skyskills.
 Each calculator is deterministic and unit-testable.
 """
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple, Union
+
+import numpy as np
+from numba import njit
+
+
+@njit('float64(float64, float64, float64, float64, float64, float64, float64, float64, float64)',
+      cache=True)
+def _stat_total_core(base, rod, armor, pet, equipment, accessory, bait, flat, multiplier):
+    """
+    Compiled core shared by the SCC and FS calculators.
+    
+    Callable from other @njit search loops with flat/multiplier
+    precomputed from set bonuses once, outside the loop.
+    """
+    return (base + rod + armor + pet + equipment + accessory + bait + flat) * multiplier
 
 
 def calculate_scc(
@@ -31,7 +47,7 @@ def calculate_scc(
         set_bonuses: Dict of set bonuses, e.g. {"scc_flat": 5, "scc_multiplier": 1.1}
     
     Returns:
-        Total SCC as float, rounded to 2 decimals
+        Total SCC as float (unrounded; round for display)
     
     Examples:
         >>> calculate_scc(0, 4, 10, 5, 0, 3, 2)
@@ -39,14 +55,17 @@ def calculate_scc(
         >>> calculate_scc(0, 10, 10, 0, 0, 0, 0, {"scc_multiplier": 1.1})
         22.0
     """
-    total = base_scc + rod_scc + armor_scc + pet_scc + equipment_scc + accessory_scc + bait_scc
+    flat_bonus = 0
+    multiplier = 1.0
     
     if set_bonuses:
         flat_bonus = set_bonuses.get('scc_flat', 0)
         multiplier = set_bonuses.get('scc_multiplier', 1.0)
-        total = (total + flat_bonus) * multiplier
     
-    return round(total, 2)
+    return _stat_total_core(
+        base_scc, rod_scc, armor_scc, pet_scc, equipment_scc, accessory_scc, bait_scc,
+        flat_bonus, multiplier
+    )
 
 
 def calculate_fishing_speed(
@@ -75,7 +94,7 @@ def calculate_fishing_speed(
         set_bonuses: Dict of set bonuses, e.g. {"fs_flat": 10, "fs_multiplier": 1.2}
     
     Returns:
-        Total FS as float, rounded to 2 decimals
+        Total FS as float (unrounded; round for display)
     
     Examples:
         >>> calculate_fishing_speed(0, 20, 15, 10, 5, 8, 2)
@@ -83,11 +102,142 @@ def calculate_fishing_speed(
         >>> calculate_fishing_speed(0, 50, 0, 0, 0, 0, 0, {"fs_multiplier": 1.5})
         75.0
     """
-    total = base_fs + rod_fs + armor_fs + pet_fs + equipment_fs + accessory_fs + bait_fs
+    flat_bonus = 0
+    multiplier = 1.0
     
     if set_bonuses:
         flat_bonus = set_bonuses.get('fs_flat', 0)
         multiplier = set_bonuses.get('fs_multiplier', 1.0)
-        total = (total + flat_bonus) * multiplier
     
-    return round(total, 2)
+    return _stat_total_core(
+        base_fs, rod_fs, armor_fs, pet_fs, equipment_fs, accessory_fs, bait_fs,
+        flat_bonus, multiplier
+    )
+
+
+
+def _apply_bonuses_batch(
+    components: np.ndarray,
+    flat_bonus: Union[float, np.ndarray],
+    multiplier: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Sum stat sources per row, then apply flat bonus and multiplier.
+    
+    Args:
+        components: (N, 7) array of base, rod, armor, pet, equipment,
+            accessory and bait values, one row per candidate loadout
+        flat_bonus: Flat set bonus, scalar or shape (N,)
+        multiplier: Set bonus multiplier, scalar or shape (N,)
+    
+    Returns:
+        (N,) float array of totals
+    """
+    total = np.asarray(components, dtype=np.float64).sum(axis=1)
+    total += flat_bonus
+    total *= multiplier
+    return total
+
+
+def calculate_scc_batch(
+    components: np.ndarray,
+    flat_bonus: Union[float, np.ndarray] = 0,
+    multiplier: Union[float, np.ndarray] = 1.0
+) -> np.ndarray:
+    """
+    Calculate total Sea Creature Chance (SCC) for many loadouts at once.
+    
+    Vectorized equivalent of calculate_scc for recommendation search.
+    
+    Args:
+        components: (N, 7) array of SCC sources in calculate_scc argument order
+        flat_bonus: Flat SCC set bonus, scalar or shape (N,)
+        multiplier: SCC set bonus multiplier, scalar or shape (N,)
+    
+    Returns:
+        (N,) float array of total SCC
+    
+    Examples:
+        >>> calculate_scc_batch(np.array([[0, 4, 10, 5, 0, 3, 2], [0, 10, 10, 0, 0, 0, 0]]),
+        ...                     multiplier=np.array([1.0, 1.1]))
+        array([24., 22.])
+    """
+    return _apply_bonuses_batch(components, flat_bonus, multiplier)
+
+
+def calculate_fishing_speed_batch(
+    components: np.ndarray,
+    flat_bonus: Union[float, np.ndarray] = 0,
+    multiplier: Union[float, np.ndarray] = 1.0
+) -> np.ndarray:
+    """
+    Calculate total Fishing Speed (FS) for many loadouts at once.
+    
+    Vectorized equivalent of calculate_fishing_speed for recommendation search.
+    
+    Args:
+        components: (N, 7) array of FS sources in calculate_fishing_speed argument order
+        flat_bonus: Flat FS set bonus, scalar or shape (N,)
+        multiplier: FS set bonus multiplier, scalar or shape (N,)
+    
+    Returns:
+        (N,) float array of total FS
+    
+    Examples:
+        >>> calculate_fishing_speed_batch(np.array([[0, 20, 15, 10, 5, 8, 2], [0, 50, 0, 0, 0, 0, 0]]),
+        ...                               multiplier=np.array([1.0, 1.5]))
+        array([60., 75.])
+    """
+    return _apply_bonuses_batch(components, flat_bonus, multiplier)
+
+
+@dataclass
+class GearStats:
+    """
+    Stat sources for N candidate loadouts, one array per gear slot.
+    
+    Each field is an (N, 2) array whose columns are (SCC, FS), so both
+    stats for a slot sit side by side and are read in a single pass.
+    """
+    base: np.ndarray
+    rod: np.ndarray
+    armor: np.ndarray
+    pet: np.ndarray
+    equipment: np.ndarray
+    accessory: np.ndarray
+    bait: np.ndarray
+
+
+def calculate_stats(
+    gear: GearStats,
+    flat_bonus: Union[float, np.ndarray] = 0,
+    multiplier: Union[float, np.ndarray] = 1.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate total SCC and FS for many loadouts in one sweep.
+    
+    Fused equivalent of calculate_scc_batch + calculate_fishing_speed_batch:
+    every gear slot is traversed once for both stats.
+    
+    Args:
+        gear: Per-slot (N, 2) arrays of (SCC, FS)
+        flat_bonus: Flat set bonus, scalar, (2,) as (scc_flat, fs_flat) or (N, 2)
+        multiplier: Set bonus multiplier, scalar, (2,) or (N, 2)
+    
+    Returns:
+        Tuple of (N,) arrays (scc, fs)
+    
+    Examples:
+        >>> gear = GearStats(*(np.array([[v, v * 5]]) for v in (0, 4, 10, 5, 0, 3, 2)))
+        >>> calculate_stats(gear)
+        (array([24.]), array([120.]))
+    """
+    total = np.array(gear.base, dtype=np.float64)
+    
+    for source in (gear.rod, gear.armor, gear.pet, gear.equipment, gear.accessory, gear.bait):
+        total += source
+    
+    total += flat_bonus
+    total *= multiplier
+    
+    return total[:, 0], total[:, 1]
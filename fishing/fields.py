@@ -0,0 +1,41 @@
+import json
+
+from django.db import models
+import orjson
+
+
+class OrJSONEncoder(json.JSONEncoder):
+    """JSON encoder backed by orjson; also serializes NumPy scalars and arrays."""
+
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, o):
+        return orjson.dumps(o, option=self.OPTIONS).decode()
+
+
+class OrJSONField(models.JSONField):
+    """
+    JSONField that encodes and decodes with orjson.
+
+    Drop-in replacement for models.JSONField; the column type and lookups
+    are unchanged. An explicit encoder or decoder still takes precedence.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('encoder', OrJSONEncoder)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if kwargs.get('encoder') is OrJSONEncoder:
+            del kwargs['encoder']
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        # None, a custom decoder, or values already decoded by the backend
+        if self.decoder is not None or not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
@@ -3,18 +3,231 @@ Hypixel API client for fetching Skyblock data.
 
 Handles rate limiting, retries, and error handling.
 """
+import asyncio
+import bisect
+import hashlib
+import itertools
+import threading
+import time
+import warnings
+import weakref
 import httpx
+import orjson
+from cachetools import TTLCache
+from django.core.cache import cache
 from tenacity import (
     retry,
-    stop_after_attempt,
-    wait_exponential,
+    stop_after_delay,
+    wait_random_exponential,
     retry_if_exception_type
 )
-from typing import Dict, Any
+from typing import Dict, Any, Awaitable, Callable, Iterable, Mapping, Optional, Union
+from uuid import UUID
 import logging
 
 logger = logging.getLogger(__name__)
 
+# One pooled AsyncClient per event loop, shared by every HypixelAPIClient
+# so TCP/TLS connections to Hypixel and Mojang are reused across lookups.
+# Views run their lookups on the single background loop from run_sync(),
+# so in practice one client serves every request in the process.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Profiles are kept in Django's cache (Redis when configured) so every
+# worker process can reuse a fetch, and in a process-local cache in front
+# of it. Both store (fetched_at, data) and honour this age end to end, so
+# a profile is never served more than PROFILES_CACHE_TTL after the fetch.
+PROFILES_CACHE_TTL = 60
+
+# IGN -> UUID is effectively static; profiles change every few minutes.
+# Only successful lookups are cached. TTLCache is not thread-safe, so every
+# access goes through _cache_get/_cache_set under _cache_lock.
+_uuid_cache: TTLCache = TTLCache(maxsize=4096, ttl=12 * 60 * 60)
+_profiles_cache: TTLCache = TTLCache(maxsize=1024, ttl=PROFILES_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+# In-flight lookups per event loop, so concurrent callers asking for the
+# same key await one request instead of each hitting the API
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cache_get(lookup_cache: TTLCache, key: str) -> Any:
+    """Read from an in-process TTL cache under the shared lock."""
+    with _cache_lock:
+        return lookup_cache.get(key)
+
+
+def _cache_set(lookup_cache: TTLCache, key: str, value: Any):
+    """Write to an in-process TTL cache under the shared lock."""
+    with _cache_lock:
+        lookup_cache[key] = value
+
+
+def _fresh_profiles(entry: Optional[tuple]) -> Optional[Dict[str, Any]]:
+    """Return the profiles in a (fetched_at, data) cache entry unless it is too old."""
+    if entry is not None and time.time() - entry[0] < PROFILES_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared lookup whose leading caller was cancelled."""
+
+
+async def _single_flight(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run fetch() once per key; concurrent callers share its result or error.
+    
+    If the caller running fetch() is cancelled, waiters are not cancelled
+    with it: one of them takes over and runs its own fetch().
+    
+    Args:
+        key: Identifies the lookup (e.g. "profiles:<uuid>:<key id>")
+        fetch: Coroutine factory performing the actual request
+    
+    Returns:
+        Result of fetch()
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    
+    while (future := inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            continue
+    
+    future = loop.create_future()
+    inflight[key] = future
+    
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight.pop(key, None)
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client for the running event loop.
+    
+    httpx connections are bound to the loop they were opened on, so a
+    client is created lazily per loop (and again if it has been closed).
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=HypixelAPIClient.TIMEOUT,
+            http2=True,
+            limits=HypixelAPIClient.LIMITS,
+        )
+        _shared_clients[loop] = client
+    
+    return client
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived event loop, starting its daemon thread on first use."""
+    global _background_loop
+    
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name='hypixel-api', daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+    
+    Sync views use this instead of asyncio.run(), which would create (and
+    discard) a new loop, and with it a new HTTP client, on every request.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result (its exception is re-raised)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def close_shared_clients():
+    """
+    Close shared HTTP clients whose event loop is still usable.
+    
+    Registered at process exit by FishingConfig.ready(). Clients on the
+    background loop are closed from within that loop.
+    """
+    for loop, client in list(_shared_clients.items()):
+        if client.is_closed or loop.is_closed():
+            continue
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+        else:
+            loop.run_until_complete(client.aclose())
+    _shared_clients.clear()
+
+
+class _TokenBucket:
+    """
+    Async token bucket limiting requests to `rate` per `period` seconds.
+    
+    Tokens are reserved under a thread lock and callers sleep off any
+    deficit, so one bucket can be shared across event loops and threads.
+    """
+    
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            self.tokens -= 1
+            
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.fill_rate
+    
+    async def __aenter__(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
 
 class HypixelAPIError(Exception):
     """Base exception for Hypixel API errors."""
@@ -37,11 +250,26 @@ class HypixelAPIClient:
     
     Handles:
     - Rate limiting (120 req/min per Hypixel docs)
-    - Retries with exponential backoff
+    - Retries with jittered exponential backoff
     - Error handling
     """
     
     BASE_URL = "https://api.hypixel.net"
+    # Per-attempt timeout; kept well under RETRY_BUDGET so a timed-out
+    # request is still retried (limiter waits count against the budget too)
+    TIMEOUT = httpx.Timeout(5.0)
+    RETRY_BUDGET = 15
+    
+    # Smooths Hypixel requests to the documented 120 req/min so we wait
+    # briefly up front instead of eating a 429 and a retry backoff
+    _limiter = _TokenBucket(120, 60)
+    # Hypixel and Mojang both speak HTTP/2, so lookups multiplex over
+    # a few long-lived connections
+    LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=32,
+        keepalive_expiry=60,
+    )
     
     # XP required for each fishing level (official Hypixel values)
     FISHING_XP_THRESHOLDS = [
@@ -63,24 +291,43 @@ class HypixelAPIClient:
             api_key: Optional Hypixel API key for authenticated requests
         """
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Profiles are cached per API key, so a lookup with an invalid key
+        # is never answered from a fetch made with someone else's key
+        self._key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else ''
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for the running event loop."""
+        return _get_shared_client()
     
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """
+        Deprecated no-op.
+        
+        The HTTP client is shared by every request, so closing it here would
+        drop connections under other lookups in flight. Its lifetime is
+        owned by close_shared_clients(), which runs at process exit.
+        """
+        warnings.warn(
+            "HypixelAPIClient.close() is a no-op; the shared HTTP client is "
+            "closed by close_shared_clients() at exit",
+            DeprecationWarning,
+            stacklevel=2
+        )
     
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError))
+        stop=stop_after_delay(RETRY_BUDGET),
+        wait=wait_random_exponential(min=1, max=8),
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        reraise=True
     )
-    async def _get(self, endpoint: str, params: Dict[str, str] = None) -> Dict[str, Any]:
+    async def _get(self, endpoint: str, params: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """
         Make GET request to Hypixel API with retry logic.
         
         Args:
             endpoint: API endpoint (e.g., "/skyblock/profiles")
-            params: Query parameters
+            params: Query parameters (not modified)
         
         Returns:
             JSON response as dict
@@ -90,16 +337,17 @@ class HypixelAPIClient:
             RateLimitError: Rate limit exceeded (429)
             HypixelAPIError: Other API errors
         """
-        if params is None:
-            params = {}
+        # Build query pairs locally so the caller's mapping is never mutated
+        query = list(params.items()) if params else []
         
         if self.api_key:
-            params['key'] = self.api_key
+            query.append(('key', self.api_key))
         
         url = f"{self.BASE_URL}{endpoint}"
         
         try:
-            response = await self.client.get(url, params=params)
+            async with self._limiter:
+                response = await self.client.get(url, params=query)
             
             if response.status_code == 404:
                 raise PlayerNotFoundError("Player not found")
@@ -109,7 +357,7 @@ class HypixelAPIClient:
                 raise HypixelAPIError(f"Server error: {response.status_code}")
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if not data.get('success'):
                 cause = data.get('cause', 'Unknown error')
@@ -140,6 +388,18 @@ class HypixelAPIClient:
         Raises:
             PlayerNotFoundError: IGN does not exist
         """
+        cache_key = ign.lower()
+        cached = _cache_get(_uuid_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        return await _single_flight(
+            f"uuid:{cache_key}",
+            lambda: self._fetch_uuid(ign, cache_key)
+        )
+    
+    async def _fetch_uuid(self, ign: str, cache_key: str) -> str:
+        """Request the UUID for an IGN from Mojang and cache it."""
         url = f"https://api.mojang.com/users/profiles/minecraft/{ign}"
         
         try:
@@ -149,12 +409,15 @@ class HypixelAPIClient:
                 raise PlayerNotFoundError(f"IGN '{ign}' not found")
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Add hyphens to UUID
-            uuid_raw = data['id']
-            uuid = f"{uuid_raw[:8]}-{uuid_raw[8:12]}-{uuid_raw[12:16]}-{uuid_raw[16:20]}-{uuid_raw[20:]}"
+            try:
+                uuid = str(UUID(hex=data['id']))
+            except ValueError:
+                raise HypixelAPIError(f"Mojang API returned an invalid UUID: {data['id']!r}")
             
+            _cache_set(_uuid_cache, cache_key, uuid)
             return uuid
         
         except httpx.HTTPStatusError as e:
@@ -176,12 +439,77 @@ class HypixelAPIClient:
             HypixelAPIError: API request failed
         """
         uuid_clean = uuid.replace('-', '')
-        data = await self._get("/v2/skyblock/profiles", {"uuid": uuid_clean})
+        cache_key = f"{uuid_clean}:{self._key_id}"
+        cached = _fresh_profiles(_cache_get(_profiles_cache, cache_key))
+        if cached is not None:
+            return cached
+        
+        return await _single_flight(
+            f"profiles:{cache_key}",
+            lambda: self._fetch_skyblock_profiles(uuid_clean, cache_key)
+        )
+    
+    async def _fetch_skyblock_profiles(self, uuid_clean: str, cache_key: str) -> Dict[str, Any]:
+        """Load Skyblock profiles from the shared cache or Hypixel and cache them."""
+        shared_key = f"hypixel:profiles:{cache_key}"
+        
+        # The shared cache is an optimization; if it is down (e.g. Redis
+        # unreachable) fall through to the API rather than failing the lookup
+        try:
+            entry = await cache.aget(shared_key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {shared_key}: {e}")
+            entry = None
+        
+        if _fresh_profiles(entry) is None:
+            data = await self._get("/v2/skyblock/profiles", {"uuid": uuid_clean})
+            
+            if not data.get('profiles'):
+                raise PlayerNotFoundError("Player has no Skyblock profiles")
+            
+            entry = (time.time(), data)
+            try:
+                await cache.aset(shared_key, entry, PROFILES_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Shared cache write failed for {shared_key}: {e}")
+        
+        # Keep the original fetch time, so the local copy expires with the shared one
+        _cache_set(_profiles_cache, cache_key, entry)
+        return entry[1]
+    
+    async def get_skyblock_profiles_bulk(
+        self, uuids: Iterable[str], concurrency: int = 20
+    ) -> Dict[str, Union[Dict[str, Any], HypixelAPIError]]:
+        """
+        Get Skyblock profiles for many players concurrently.
         
-        if not data.get('profiles'):
-            raise PlayerNotFoundError("Player has no Skyblock profiles")
+        Requests still pass through the cache, single-flight and rate
+        limiter, so concurrency only bounds how many are outstanding.
         
-        return data
+        Args:
+            uuids: Player UUIDs (with or without hyphens)
+            concurrency: Maximum number of lookups in flight at once
+        
+        Returns:
+            Dict mapping each UUID as given to its profiles dict, or to
+            the HypixelAPIError raised for that player (timeouts and
+            network errors are wrapped in one)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(uuid: str):
+            async with semaphore:
+                try:
+                    return uuid, await self.get_skyblock_profiles(uuid)
+                except HypixelAPIError as e:
+                    return uuid, e
+                except httpx.TransportError as e:
+                    # Retries exhausted; report it for this UUID only
+                    error = HypixelAPIError(f"Request failed: {type(e).__name__}")
+                    error.__cause__ = e
+                    return uuid, error
+        
+        return dict(await asyncio.gather(*(fetch_one(u) for u in uuids)))
     
     async def get_player_data(self, uuid: str) -> Dict[str, Any]:
         """
@@ -253,7 +581,8 @@ class HypixelAPIClient:
             'cute_name': profile.get('cute_name')
         }
     
-    def _xp_to_level(self, xp: float) -> int:
+    @classmethod
+    def _xp_to_level(cls, xp: float) -> int:
         """
         Convert fishing XP to fishing level using official thresholds.
         
@@ -263,11 +592,10 @@ class HypixelAPIClient:
         Returns:
             Fishing level (0-50)
         """
-        cumulative_xp = 0
-        
-        for level, required_xp in enumerate(self.FISHING_XP_THRESHOLDS):
-            cumulative_xp += required_xp
-            if xp < cumulative_xp:
-                return level
-        
-        return 50  # Max level
+        # First cumulative threshold strictly above xp is the current level
+        level = bisect.bisect_right(cls._CUMULATIVE_XP, xp)
+        return min(level, 50)  # Max level
+
+
+# Running totals of FISHING_XP_THRESHOLDS, computed once at import
+HypixelAPIClient._CUMULATIVE_XP = tuple(itertools.accumulate(HypixelAPIClient.FISHING_XP_THRESHOLDS))
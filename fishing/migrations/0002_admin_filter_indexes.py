@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['island'], name='fishing_loc_island_125bd8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['water_or_lava'], name='fishing_loc_water_o_6778aa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['active'], name='fishing_loc_active_db88c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profilesnapshot',
+            index=models.Index(fields=['skill_fishing_level'], name='fishing_pro_skill_f_1c55d6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['version'], name='fishing_rec_version_bd167c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['created_at'], name='fishing_rec_created_058a95_idx'),
+        ),
+    ]
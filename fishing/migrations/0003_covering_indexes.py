@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0002_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bazaarprice',
+            name='fishing_baz_item_id_b0aae5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='profilesnapshot',
+            name='fishing_pro_player__f582ae_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='recommendation',
+            name='fishing_rec_snapsho_1e9984_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bazaarprice',
+            index=models.Index(fields=['item', '-source_ts'], include=('price',), name='bazaar_item_ts_inc'),
+        ),
+        migrations.AddIndex(
+            model_name='profilesnapshot',
+            index=models.Index(fields=['player', '-created_at'], include=('hypixel_profile_id', 'skill_fishing_level'), name='snap_latest_inc'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['snapshot', '-created_at'], include=('score', 'version'), name='rec_snap_ct_inc'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:42
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_denormalized_fields(apps, schema_editor):
+    Recommendation = apps.get_model('fishing', 'Recommendation')
+    ProfileSnapshot = apps.get_model('fishing', 'ProfileSnapshot')
+    snapshot = ProfileSnapshot.objects.filter(pk=OuterRef('snapshot_id'))
+    Recommendation.objects.update(
+        player_ign=Subquery(snapshot.values('player__ign')[:1]),
+        snapshot_fishing_level=Subquery(snapshot.values('skill_fishing_level')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0003_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendation',
+            name='player_ign',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='recommendation',
+            name='snapshot_fishing_level',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_denormalized_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:42
+
+import orjson
+import zstandard
+from django.db import migrations, models
+
+
+def compress_raw_json(apps, schema_editor):
+    ProfileSnapshot = apps.get_model('fishing', 'ProfileSnapshot')
+    compressor = zstandard.ZstdCompressor(level=6)
+    batch = []
+    for snapshot in ProfileSnapshot.objects.only('id', 'raw_json').iterator(chunk_size=500):
+        snapshot.raw_json_zstd = compressor.compress(orjson.dumps(snapshot.raw_json))
+        batch.append(snapshot)
+        if len(batch) >= 500:
+            ProfileSnapshot.objects.bulk_update(batch, ['raw_json_zstd'])
+            batch = []
+    if batch:
+        ProfileSnapshot.objects.bulk_update(batch, ['raw_json_zstd'])
+
+
+def decompress_raw_json(apps, schema_editor):
+    ProfileSnapshot = apps.get_model('fishing', 'ProfileSnapshot')
+    decompressor = zstandard.ZstdDecompressor()
+    batch = []
+    for snapshot in ProfileSnapshot.objects.only('id', 'raw_json_zstd').iterator(chunk_size=500):
+        data = snapshot.raw_json_zstd
+        snapshot.raw_json = orjson.loads(decompressor.decompress(data)) if data else {}
+        batch.append(snapshot)
+        if len(batch) >= 500:
+            ProfileSnapshot.objects.bulk_update(batch, ['raw_json'])
+            batch = []
+    if batch:
+        ProfileSnapshot.objects.bulk_update(batch, ['raw_json'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0004_recommendation_denormalized_player'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profilesnapshot',
+            name='raw_json_zstd',
+            field=models.BinaryField(default=bytes, help_text='Full Hypixel API response for reproducibility (zstd-compressed JSON)'),
+        ),
+        migrations.RunPython(compress_raw_json, decompress_raw_json),
+        migrations.RemoveField(
+            model_name='profilesnapshot',
+            name='raw_json',
+        ),
+    ]
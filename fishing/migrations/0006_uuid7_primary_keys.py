@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:48
+
+import fishing.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0005_compress_snapshot_raw_json'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bazaarprice',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='dataversion',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='gearset',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='method',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='profilesnapshot',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='recommendation',
+            name='id',
+            field=models.UUIDField(default=fishing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
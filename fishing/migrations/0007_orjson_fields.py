@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:49
+
+import fishing.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0006_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gearset',
+            name='requirements',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Requirements: min_level, island, quest_completion, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='gearset',
+            name='set_bonuses',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Set bonuses applied when full set equipped'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='attributes',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Special attributes, reforge info, pet level, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='base_stats',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Base stats: SCC, FS, Wisdom, MF, Health, Defense, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='requirements',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Requirements: min_level, quest, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='method',
+            name='requirements',
+            field=fishing.fields.OrJSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='profilesnapshot',
+            name='derived_stats',
+            field=fishing.fields.OrJSONField(default=dict, help_text='Computed stats: SCC, FS, Wisdom, MF, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='recommendation',
+            name='breakdown_json',
+            field=fishing.fields.OrJSONField(help_text='Factor breakdown: XP/hr, Profit/hr, SCC, FS, etc.'),
+        ),
+        migrations.AlterField(
+            model_name='recommendation',
+            name='top_choice_json',
+            field=fishing.fields.OrJSONField(help_text='Top recommended gear/location/method'),
+        ),
+    ]
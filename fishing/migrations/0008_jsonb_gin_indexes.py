@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-15 01:50
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fishing', '0007_orjson_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['base_stats'], name='item_base_stats_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['attributes'], name='item_attributes_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='profilesnapshot',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['derived_stats'], name='snap_derived_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
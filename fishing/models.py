@@ -1,6 +1,31 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+import orjson
+import os
+import time
 import uuid
+import zstandard
+
+from .fields import OrJSONField
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    New rows land at the right-hand edge of the primary key index instead of
+    at random pages, which keeps inserts from splitting pages all over the
+    B-tree while keeping the same 16-byte UUID column.
+    """
+    rand = int.from_bytes(os.urandom(10), 'big')
+    return uuid.UUID(int=(
+        (time.time_ns() // 1_000_000) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    ))
 
 
 class Player(models.Model):
@@ -16,29 +41,112 @@ class Player(models.Model):
         return self.ign
 
 
+class SnapshotQuerySet(models.QuerySet):
+    def with_player(self):
+        """Join the player in the same query (used by __str__ and listings)."""
+        return self.select_related('player')
+
+    def with_recommendations(self):
+        """Prefetch each snapshot's recommendations in one extra query.
+
+        prefetch_related ignores defer() on the outer queryset, so the
+        column list is set on the Prefetch queryset instead; breakdown_json
+        is left out as listings only show the top choice. The denormalized
+        player_ign/snapshot_fishing_level are kept, since __str__ and
+        listings read them.
+        """
+        return self.prefetch_related(models.Prefetch(
+            'recommendations',
+            queryset=Recommendation.objects.only(
+                'id', 'snapshot_id', 'score', 'version', 'created_at', 'top_choice_json',
+                'player_ign', 'snapshot_fishing_level',
+            ),
+        ))
+
+    def without_raw_json(self):
+        """Skip loading the compressed API response (for listings)."""
+        return self.defer('raw_json_zstd')
+
+
+class SnapshotManager(models.Manager.from_queryset(SnapshotQuerySet)):
+    """Default snapshot manager; eager loading is opt-in via the queryset methods."""
+
+    def ingest_snapshots(self, rows, batch_size=1000):
+        """
+        Insert many snapshots with batched INSERTs (backfills, re-fetch jobs).
+
+        Args:
+            rows: Iterable of dicts of ProfileSnapshot field values; raw_json
+                is accepted and compressed like on single saves
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            List of created ProfileSnapshot instances
+        """
+        return self.bulk_create(
+            [self.model(**row) for row in rows],
+            batch_size=batch_size,
+        )
+
+
 class ProfileSnapshot(models.Model):
     """A snapshot of a player's Hypixel Skyblock profile at a point in time."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='snapshots')
     hypixel_profile_id = models.CharField(max_length=64, db_index=True)
     skill_fishing_level = models.IntegerField(default=0)
-    raw_json = models.JSONField(default=dict, help_text="Full Hypixel API response for reproducibility")
-    derived_stats = models.JSONField(
+    raw_json_zstd = models.BinaryField(
+        default=bytes,
+        help_text="Full Hypixel API response for reproducibility (zstd-compressed JSON)"
+    )
+    derived_stats = OrJSONField(
         default=dict,
         help_text="Computed stats: SCC, FS, Wisdom, MF, etc."
     )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    objects = SnapshotManager()
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['player', '-created_at']),
+            # Covers "latest snapshot per player" without touching the heap
+            models.Index(
+                fields=['player', '-created_at'],
+                include=['hypixel_profile_id', 'skill_fishing_level'],
+                name='snap_latest_inc',
+            ),
             models.Index(fields=['hypixel_profile_id']),
+            models.Index(fields=['skill_fishing_level']),
+            # jsonb_path_ops: smaller than the default opclass, serves @> containment
+            GinIndex(fields=['derived_stats'], name='snap_derived_gin', opclasses=['jsonb_path_ops']),
         ]
 
     def __str__(self):
         return f"{self.player.ign} L{self.skill_fishing_level} @ {self.created_at.isoformat()}"
 
+    @property
+    def raw_json(self):
+        """
+        Full Hypixel API response, decompressed on first access.
+
+        The decoded value is memoized against the exact raw_json_zstd object
+        it came from, so refresh_from_db() or assigning raw_json_zstd
+        directly is picked up on the next access.
+        """
+        data = self.raw_json_zstd
+        memo = self.__dict__.get('_raw_json')
+        if memo is None or memo[0] is not data:
+            decoded = orjson.loads(zstandard.ZstdDecompressor().decompress(data)) if data else {}
+            memo = (data, decoded)
+            self._raw_json = memo
+        return memo[1]
+
+    @raw_json.setter
+    def raw_json(self, value):
+        self.raw_json_zstd = zstandard.ZstdCompressor(level=6).compress(orjson.dumps(value))
+        self._raw_json = (self.raw_json_zstd, value)
+
 
 class Item(models.Model):
     """A Hypixel Skyblock item (rod, armor, pet, accessory, bait, equipment)."""
@@ -54,15 +162,15 @@ class Item(models.Model):
         ('bait', 'Bait'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=128, unique=True, db_index=True)
     item_type = models.CharField(max_length=20, choices=ITEM_TYPES)
     rarity = models.CharField(max_length=20, default='COMMON')
-    base_stats = models.JSONField(
+    base_stats = OrJSONField(
         default=dict,
         help_text="Base stats: SCC, FS, Wisdom, MF, Health, Defense, etc."
     )
-    attributes = models.JSONField(
+    attributes = OrJSONField(
         default=dict,
         help_text="Special attributes, reforge info, pet level, etc."
     )
@@ -77,21 +185,38 @@ class Item(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            GinIndex(fields=['base_stats'], name='item_base_stats_gin', opclasses=['jsonb_path_ops']),
+            GinIndex(fields=['attributes'], name='item_attributes_gin', opclasses=['jsonb_path_ops']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.rarity} {self.get_item_type_display()})"
 
 
+class GearSetQuerySet(models.QuerySet):
+    def with_pieces(self, active_only=False):
+        """Prefetch the M2M pieces (select_related cannot follow M2M).
+
+        Only the columns needed to compute set stats are loaded; the other
+        JSON columns on Item can be large.
+        """
+        pieces = Item.objects.only('id', 'name', 'item_type', 'rarity', 'base_stats')
+        if active_only:
+            pieces = pieces.filter(active=True)
+        return self.prefetch_related(models.Prefetch('pieces', queryset=pieces))
+
+
 class GearSet(models.Model):
     """A complete gear loadout (armor + rod + pet + accessories + equipment)."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=128, unique=True)
     pieces = models.ManyToManyField(Item, related_name='gear_sets')
-    set_bonuses = models.JSONField(
+    set_bonuses = OrJSONField(
         default=dict,
         help_text="Set bonuses applied when full set equipped"
     )
-    requirements = models.JSONField(
+    requirements = OrJSONField(
         default=dict,
         help_text="Requirements: min_level, island, quest_completion, etc."
     )
@@ -100,6 +225,8 @@ class GearSet(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = GearSetQuerySet.as_manager()
+
     class Meta:
         ordering = ['name']
 
@@ -109,7 +236,7 @@ class GearSet(models.Model):
 
 class Location(models.Model):
     """A fishing location in Hypixel Skyblock."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=128, unique=True)
     coords = models.CharField(max_length=64, blank=True, help_text="x y z coords")
     water_or_lava = models.CharField(
@@ -118,7 +245,7 @@ class Location(models.Model):
         default='water'
     )
     island = models.CharField(max_length=64, default='Hub')
-    requirements = models.JSONField(
+    requirements = OrJSONField(
         default=dict,
         help_text="Requirements: min_level, quest, etc."
     )
@@ -128,6 +255,11 @@ class Location(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['island']),
+            models.Index(fields=['water_or_lava']),
+            models.Index(fields=['active']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.island})"
@@ -135,10 +267,10 @@ class Location(models.Model):
 
 class Method(models.Model):
     """A fishing method/strategy."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=128, unique=True)
     description = models.TextField()
-    requirements = models.JSONField(default=dict)
+    requirements = OrJSONField(default=dict)
     tags = ArrayField(models.CharField(max_length=50), default=list, blank=True)
     calculators_used = ArrayField(
         models.CharField(max_length=50),
@@ -158,31 +290,48 @@ class Method(models.Model):
 
 class Recommendation(models.Model):
     """A computed recommendation for a profile snapshot."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     snapshot = models.ForeignKey(ProfileSnapshot, on_delete=models.CASCADE, related_name='recommendations')
-    top_choice_json = models.JSONField(
+    top_choice_json = OrJSONField(
         help_text="Top recommended gear/location/method"
     )
-    breakdown_json = models.JSONField(
+    breakdown_json = OrJSONField(
         help_text="Factor breakdown: XP/hr, Profit/hr, SCC, FS, etc."
     )
     score = models.FloatField()
     version = models.CharField(max_length=32, help_text="Data version + calculator version")
+    # Denormalized copies of snapshot.player.ign / snapshot.skill_fishing_level so
+    # listings avoid the snapshot -> player join. Written on save, so they reflect
+    # the source rows at that time (e.g. not updated if the player renames).
+    player_ign = models.CharField(max_length=16, db_index=True, default='', editable=False)
+    snapshot_fishing_level = models.IntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['snapshot', '-created_at']),
+            # Covers "latest recommendation for a snapshot" as an index-only scan
+            models.Index(
+                fields=['snapshot', '-created_at'],
+                include=['score', 'version'],
+                name='rec_snap_ct_inc',
+            ),
+            models.Index(fields=['version']),
+            models.Index(fields=['created_at']),
         ]
 
+    def save(self, *args, **kwargs):
+        self.player_ign = self.snapshot.player.ign
+        self.snapshot_fishing_level = self.snapshot.skill_fishing_level
+        super().save(*args, **kwargs)
+
     def __str__(self):
-        return f"Rec for {self.snapshot.player.ign} @ {self.created_at.isoformat()}"
+        return f"Rec for {self.player_ign} @ {self.created_at.isoformat()}"
 
 
 class DataVersion(models.Model):
     """Tracks data/calculator versions for cache invalidation."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     domain = models.CharField(
         max_length=32,
         unique=True,
@@ -201,7 +350,7 @@ class DataVersion(models.Model):
 
 class BazaarPrice(models.Model):
     """Tracks Bazaar/AH prices for items (stub for Phase 7+)."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name='prices')
     price = models.DecimalField(max_digits=15, decimal_places=2)
     source_ts = models.DateTimeField(db_index=True)
@@ -210,7 +359,8 @@ class BazaarPrice(models.Model):
     class Meta:
         ordering = ['-source_ts']
         indexes = [
-            models.Index(fields=['item', '-source_ts']),
+            # Price history for an item, answered from the index alone
+            models.Index(fields=['item', '-source_ts'], include=['price'], name='bazaar_item_ts_inc'),
         ]
 
     def __str__(self):
@@ -3,34 +3,257 @@ Advanced fishing stats calculator for Hypixel SkyBlock.
 
 Calculates derived stats like SCC, Magic Find, effective stats, etc.
 """
-from typing import Dict, Any, List
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
 import re
+import sys
 
+import numpy as np
+from numba import njit
 
-class FishingStatsCalculator:
-    """Calculate advanced fishing statistics from profile data."""
-    
-    # Trophy fish tiers
-    TROPHY_FISH_TIERS = {
-        'sulphur_skitter': ['bronze', 'silver', 'gold', 'diamond'],
-        'obfuscated_1': ['bronze', 'silver', 'gold', 'diamond'],
-        'obfuscated_2': ['bronze', 'silver', 'gold', 'diamond'],
-        'obfuscated_3': ['bronze', 'silver', 'gold', 'diamond'],
-        'steaminghot_flounder': ['bronze', 'silver', 'gold', 'diamond'],
-        'gusher': ['bronze', 'silver', 'gold', 'diamond'],
-        'blobfish': ['bronze', 'silver', 'gold', 'diamond'],
-        'slugfish': ['bronze', 'silver', 'gold', 'diamond'],
-        'flyfish': ['bronze', 'silver', 'gold', 'diamond'],
-        'lavahorse': ['bronze', 'silver', 'gold', 'diamond'],
-        'mana_ray': ['bronze', 'silver', 'gold', 'diamond'],
-        'volcanic_stonefish': ['bronze', 'silver', 'gold', 'diamond'],
-        'vanille': ['bronze', 'silver', 'gold', 'diamond'],
-        'skeleton_fish': ['bronze', 'silver', 'gold', 'diamond'],
-        'moldfin': ['bronze', 'silver', 'gold', 'diamond'],
-        'soul_fish': ['bronze', 'silver', 'gold', 'diamond'],
-        'karate_fish': ['bronze', 'silver', 'gold', 'diamond'],
-        'golden_fish': ['bronze', 'silver', 'gold', 'diamond'],
+# Trophy fish tiers in index order for _aggregate_trophies
+_TIERS = ('bronze', 'silver', 'gold', 'diamond')
+_TIER_INDEX = {tier: i for i, tier in enumerate(_TIERS)}
+
+# Trophy fish tiers (every fish shares the one read-only tier tuple)
+TROPHY_FISH_TIERS = MappingProxyType(dict.fromkeys((
+    'sulphur_skitter', 'obfuscated_1', 'obfuscated_2',
+    'obfuscated_3', 'steaminghot_flounder', 'gusher',
+    'blobfish', 'slugfish', 'flyfish',
+    'lavahorse', 'mana_ray', 'volcanic_stonefish',
+    'vanille', 'skeleton_fish', 'moldfin',
+    'soul_fish', 'karate_fish', 'golden_fish',
+), _TIERS))
+
+# Notable creatures for fishing
+NOTABLE_CREATURES = MappingProxyType({
+    'water_hydra': 'Water Hydra',
+    'the_sea_emperor': 'Sea Emperor',
+    'thunder': 'Thunder',
+    'lord_jawbus': 'Lord Jawbus',
+    'great_white_shark': 'Great White Shark',
+    'yeti': 'Yeti',
+})
+
+# Recommendation tables: bisect_right(BUCKETS, value) indexes MSGS.
+# Level messages overlap (25-29 and 26+), hence the extra 26 bound.
+_LEVEL_BUCKETS = (25, 26, 30, 40)
+_LEVEL_MSGS = (
+    ("�� Focus on leveling fishing to unlock better loot pools",),
+    ("🏆 Start trophy fishing in the Crimson Isle for better loot",),
+    ("🏆 Start trophy fishing in the Crimson Isle for better loot",
+     "✅ You can fish for Great White Sharks and Thunder"),
+    ("✅ You can fish for Great White Sharks and Thunder",),
+    ("✅ You can fish for Great White Sharks and Thunder",
+     "🌊 High fishing level! You have access to all sea creatures"),
+)
+
+_TROPHY_BUCKETS = (1, 100, 1000)
+_TROPHY_MSGS = (
+    "🐠 Start trophy fishing to improve your Fishing Speed and earn rewards!".format,
+    "🐠 Catch more trophy fish to increase your Fishing Speed".format,
+    "💎 Focus on catching diamond trophy fish for better rewards".format,
+    "🌟 Impressive! You've caught {} trophy fish!".format,
+)
+
+_FIRST_DIAMOND_MSG = "💎 Try to catch your first diamond trophy fish!"
+_DIAMOND_BUCKETS = (10, 50)
+_DIAMOND_MSGS = (
+    "💎 You need more diamond trophy fish (current: {})".format,
+    "💎 Good progress on diamond trophies! ({}/50)".format,
+    "🌟 Outstanding! You have {} diamond trophy fish".format,
+)
+
+
+@njit
+def _aggregate_trophies(tier_ix, counts):
+    """Sum counts per tier index (negative indexes are ignored)."""
+    out = np.zeros(4, np.int64)
+    for i in range(tier_ix.size):
+        t = tier_ix[i]
+        if t >= 0:
+            out[t] += counts[i]
+    return out
+
+
+def calculate_trophy_fish_stats(trophy_fish: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Calculate trophy fish statistics.
+    
+    Args:
+        trophy_fish: Dict of trophy fish counts from API
+    
+    Returns:
+        Dict with trophy fish breakdown by tier
+    """
+    # Parse numeric entries once (e.g., "sulphur_skitter_bronze" -> name, tier)
+    fish_names = []
+    tier_ix = []
+    counts = []
+    for fish_key, count in trophy_fish.items():
+        # Skip non-numeric values
+        if not isinstance(count, (int, float)):
+            continue
+        
+        # rpartition returns a tuple (no list allocation); a key without "_"
+        # leaves sep empty and tier as the whole key, which never matches
+        fish_name, sep, tier = fish_key.rpartition('_')
+        ix = _TIER_INDEX.get(tier)
+        if sep and ix is not None:
+            # by_fish keys outlive the request in the stats cache; intern them so
+            # every cached result shares one string per fish name
+            fish_names.append(sys.intern(fish_name))
+            tier_ix.append(ix)
+            counts.append(int(count))
+    
+    # All four tier sums in one compiled pass
+    by_tier_counts = _aggregate_trophies(
+        np.array(tier_ix, dtype=np.int8),
+        np.array(counts, dtype=np.int64)
+    ).tolist()
+    
+    by_fish = {}
+    for fish_name, ix, count in zip(fish_names, tier_ix, counts):
+        fish = by_fish.get(fish_name)
+        if fish is None:
+            fish = by_fish[fish_name] = {'total': 0, 'tiers': {}}
+        fish['total'] += count
+        fish['tiers'][_TIERS[ix]] = count
+    
+    return {
+        'total_caught': sum(by_tier_counts),
+        'by_tier': dict(zip(_TIERS, by_tier_counts)),
+        'by_fish': by_fish
+    }
+
+
+def calculate_sea_creature_stats(sea_creature_kills: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calculate sea creature kill statistics.
+    
+    Args:
+        sea_creature_kills: Dict of sea creature kills from API
+    
+    Returns:
+        Dict with sea creature stats
+    """
+    total_kills = 0
+    unique_types = 0
+    notable = {}
+    
+    # Single pass: sum, count and pick out notable creatures together
+    for creature_id, kill_count in sea_creature_kills.items():
+        # Exact int check first; isinstance covers floats and subclasses
+        if type(kill_count) is int or isinstance(kill_count, (int, float)):
+            kill_count = int(kill_count)
+            total_kills += kill_count
+            unique_types += 1
+            
+            display_name = NOTABLE_CREATURES.get(creature_id)
+            if display_name is not None:
+                notable[display_name] = kill_count
+    
+    return {
+        'total_kills': total_kills,
+        'unique_types': unique_types,
+        # Keep NOTABLE_CREATURES display order regardless of API key order
+        'notable': {name: notable[name] for name in NOTABLE_CREATURES.values() if name in notable}
     }
+
+
+def get_fishing_recommendations(fishing_level: int, fishing_xp: float,
+                                trophy_stats: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Generate fishing recommendations based on current stats.
+    
+    Args:
+        fishing_level: Current fishing level
+        fishing_xp: Current fishing XP
+        trophy_stats: Trophy fish statistics
+    
+    Returns:
+        Tuple of recommendation strings
+    """
+    total_trophy = trophy_stats['total_caught']
+    diamond_count = trophy_stats['by_tier']['diamond']
+    
+    # Diamond trophy count
+    if diamond_count == 0 and total_trophy > 0:
+        diamond_msg = _FIRST_DIAMOND_MSG
+    else:
+        diamond_msg = _DIAMOND_MSGS[bisect_right(_DIAMOND_BUCKETS, diamond_count)](diamond_count)
+    
+    # Level messages are prebuilt tuples; only the count messages are formatted
+    return _LEVEL_MSGS[bisect_right(_LEVEL_BUCKETS, fishing_level)] + (
+        _TROPHY_MSGS[bisect_right(_TROPHY_BUCKETS, total_trophy)](total_trophy),
+        diamond_msg,
+    )
+
+
+def calculate_all_stats(fishing_level: int, fishing_xp: float,
+                        trophy_fish: Dict[str, int],
+                        sea_creature_kills: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calculate all advanced fishing stats.
+    
+    Results are memoized on the numeric content of the inputs, so the
+    returned dict is shared between calls and must not be mutated.
+    
+    Returns comprehensive stats dict.
+    """
+    return _calculate_all_stats_cached(
+        fishing_level,
+        fishing_xp,
+        _numeric_items(trophy_fish),
+        _numeric_items(sea_creature_kills)
+    )
+
+
+def _numeric_items(counts: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Hashable, order-independent key of the numeric entries of a counts dict."""
+    return tuple(sorted(
+        (key, value) for key, value in counts.items()
+        if isinstance(value, (int, float))
+    ))
+
+
+@lru_cache(maxsize=512)
+def _calculate_all_stats_cached(fishing_level: int, fishing_xp: float,
+                                trophy_items: Tuple[Tuple[str, Any], ...],
+                                sea_creature_items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """
+    Memoized body of calculate_all_stats.
+    
+    The result depends only on the arguments, so entries never go stale;
+    clear_stats_cache() exists for tests and manual resets.
+    """
+    trophy_stats = calculate_trophy_fish_stats(dict(trophy_items))
+    sea_creature_stats = calculate_sea_creature_stats(dict(sea_creature_items))
+    recommendations = get_fishing_recommendations(fishing_level, fishing_xp, trophy_stats)
+    
+    return {
+        'trophy_fish': trophy_stats,
+        'sea_creatures': sea_creature_stats,
+        'recommendations': recommendations
+    }
+
+
+def clear_stats_cache():
+    """Drop memoized calculate_all_stats results (not needed for correctness)."""
+    _calculate_all_stats_cached.cache_clear()
+
+
+class FishingStatsCalculator:
+    """
+    Calculate advanced fishing statistics from profile data.
+    
+    Backwards-compatible wrapper; the calculations are stateless
+    module-level functions and can be called directly.
+    """
+    
+    TROPHY_FISH_TIERS = TROPHY_FISH_TIERS
     
     def __init__(self, profile_data: Dict[str, Any], uuid: str):
         """
@@ -44,150 +267,12 @@ class FishingStatsCalculator:
         self.uuid_clean = uuid.replace('-', '')
         self.member = profile_data.get('members', {}).get(self.uuid_clean, {})
     
-    def calculate_trophy_fish_stats(self, trophy_fish: Dict[str, int]) -> Dict[str, Any]:
-        """
-        Calculate trophy fish statistics.
-        
-        Args:
-            trophy_fish: Dict of trophy fish counts from API
-        
-        Returns:
-            Dict with trophy fish breakdown by tier
-        """
-        stats = {
-            'total_caught': 0,
-            'by_tier': {'bronze': 0, 'silver': 0, 'gold': 0, 'diamond': 0},
-            'by_fish': {}
-        }
-        
-        for fish_key, count in trophy_fish.items():
-            # Skip non-numeric values
-            if not isinstance(count, (int, float)):
-                continue
-            
-            # Parse fish name and tier (e.g., "sulphur_skitter_bronze")
-            parts = fish_key.rsplit('_', 1)
-            if len(parts) == 2:
-                fish_name, tier = parts
-                if tier in stats['by_tier']:
-                    stats['by_tier'][tier] += int(count)
-                    stats['total_caught'] += int(count)
-                    
-                    if fish_name not in stats['by_fish']:
-                        stats['by_fish'][fish_name] = {'total': 0, 'tiers': {}}
-                    
-                    stats['by_fish'][fish_name]['total'] += int(count)
-                    stats['by_fish'][fish_name]['tiers'][tier] = int(count)
-        
-        return stats
-    
-    def calculate_sea_creature_stats(self, sea_creature_kills: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Calculate sea creature kill statistics.
-        
-        Args:
-            sea_creature_kills: Dict of sea creature kills from API
-        
-        Returns:
-            Dict with sea creature stats
-        """
-        # Notable creatures for fishing
-        notable_creatures = {
-            'water_hydra': 'Water Hydra',
-            'the_sea_emperor': 'Sea Emperor',
-            'thunder': 'Thunder',
-            'lord_jawbus': 'Lord Jawbus',
-            'great_white_shark': 'Great White Shark',
-            'yeti': 'Yeti',
-        }
-        
-        stats = {
-            'total_kills': 0,
-            'unique_types': 0,
-            'notable': {}
-        }
-        
-        # Filter out non-numeric values and sum
-        numeric_kills = {}
-        for creature_id, kill_count in sea_creature_kills.items():
-            if isinstance(kill_count, (int, float)):
-                numeric_kills[creature_id] = int(kill_count)
-        
-        stats['total_kills'] = sum(numeric_kills.values())
-        stats['unique_types'] = len(numeric_kills)
-        
-        # Extract notable creatures
-        for creature_id, display_name in notable_creatures.items():
-            if creature_id in numeric_kills:
-                stats['notable'][display_name] = numeric_kills[creature_id]
-        
-        return stats
-    
-    def get_fishing_recommendations(self, fishing_level: int, fishing_xp: float, 
-                                   trophy_stats: Dict[str, Any]) -> List[str]:
-        """
-        Generate fishing recommendations based on current stats.
-        
-        Args:
-            fishing_level: Current fishing level
-            fishing_xp: Current fishing XP
-            trophy_stats: Trophy fish statistics
-        
-        Returns:
-            List of recommendation strings
-        """
-        recommendations = []
-        
-        # Level-based recommendations
-        if fishing_level < 25:
-            recommendations.append("�� Focus on leveling fishing to unlock better loot pools")
-        elif fishing_level < 30:
-            recommendations.append("🏆 Start trophy fishing in the Crimson Isle for better loot")
-        
-        if fishing_level >= 26:
-            recommendations.append("✅ You can fish for Great White Sharks and Thunder")
-        
-        if fishing_level >= 40:
-            recommendations.append("🌊 High fishing level! You have access to all sea creatures")
-        
-        # Trophy fish recommendations
-        total_trophy = trophy_stats['total_caught']
-        if total_trophy == 0:
-            recommendations.append("🐠 Start trophy fishing to improve your Fishing Speed and earn rewards!")
-        elif total_trophy < 100:
-            recommendations.append("🐠 Catch more trophy fish to increase your Fishing Speed")
-        elif total_trophy < 1000:
-            recommendations.append("💎 Focus on catching diamond trophy fish for better rewards")
-        else:
-            recommendations.append("🌟 Impressive! You've caught {} trophy fish!".format(total_trophy))
-        
-        # Diamond trophy count
-        diamond_count = trophy_stats['by_tier']['diamond']
-        if diamond_count == 0 and total_trophy > 0:
-            recommendations.append("💎 Try to catch your first diamond trophy fish!")
-        elif diamond_count < 10:
-            recommendations.append("💎 You need more diamond trophy fish (current: {})".format(diamond_count))
-        elif diamond_count < 50:
-            recommendations.append("💎 Good progress on diamond trophies! ({}/50)".format(diamond_count))
-        elif diamond_count >= 50:
-            recommendations.append("🌟 Outstanding! You have {} diamond trophy fish".format(diamond_count))
-        
-        return recommendations
+    calculate_trophy_fish_stats = staticmethod(calculate_trophy_fish_stats)
+    calculate_sea_creature_stats = staticmethod(calculate_sea_creature_stats)
+    get_fishing_recommendations = staticmethod(get_fishing_recommendations)
     
     def calculate_all_stats(self, fishing_level: int, fishing_xp: float,
                            trophy_fish: Dict[str, int],
                            sea_creature_kills: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Calculate all advanced fishing stats.
-        
-        Returns comprehensive stats dict.
-        """
-        trophy_stats = self.calculate_trophy_fish_stats(trophy_fish)
-        sea_creature_stats = self.calculate_sea_creature_stats(sea_creature_kills)
-        recommendations = self.get_fishing_recommendations(fishing_level, fishing_xp, trophy_stats)
-        
-        return {
-            'trophy_fish': trophy_stats,
-            'sea_creatures': sea_creature_stats,
-            'recommendations': recommendations
-        }
+        """Calculate all advanced fishing stats (see calculate_all_stats)."""
+        return calculate_all_stats(fishing_level, fishing_xp, trophy_fish, sea_creature_kills)
@@ -2,8 +2,16 @@
 Unit tests for fishing calculators.
 Each test validates a specific calculation scenario.
 """
+import numpy as np
 import pytest
-from fishing.calculators import calculate_scc, calculate_fishing_speed
+from fishing.calculators import (
+    calculate_scc,
+    calculate_fishing_speed,
+    calculate_scc_batch,
+    calculate_fishing_speed_batch,
+    calculate_stats,
+    GearStats
+)
 
 
 class TestSCCCalculator:
@@ -72,8 +80,8 @@ class TestSCCCalculator:
         result = calculate_scc(0, 0, 0, 0, 0, 0, 0)
         assert result == 0.0
     
-    def test_scc_rounding(self):
-        """Test SCC rounds to 2 decimal places."""
+    def test_scc_fractional_multiplier(self):
+        """Test SCC with a fractional multiplier (result is not rounded)."""
         result = calculate_scc(
             base_scc=0,
             rod_scc=10,
@@ -153,3 +161,61 @@ class TestFishingSpeedCalculator:
         """Test FS with all zeroes."""
         result = calculate_fishing_speed(0, 0, 0, 0, 0, 0, 0)
         assert result == 0.0
+
+
+class TestBatchCalculators:
+    """Test vectorized SCC/FS calculators against the scalar versions."""
+    
+    def test_scc_batch_matches_scalar(self):
+        """Test each batch row equals the scalar SCC result."""
+        components = np.array([
+            [0, 4, 10, 5, 0, 3, 2],
+            [0, 10, 10, 0, 0, 0, 0],
+            [0, 10, 5, 0, 0, 0, 0],
+        ])
+        flat = np.array([0, 0, 5])
+        mult = np.array([1.0, 1.1, 1.2])
+        
+        result = calculate_scc_batch(components, flat, mult)
+        
+        expected = [
+            calculate_scc(*row, set_bonuses={"scc_flat": f, "scc_multiplier": m})
+            for row, f, m in zip(components.tolist(), flat.tolist(), mult.tolist())
+        ]
+        assert result.tolist() == expected
+    
+    def test_fs_batch_scalar_bonuses(self):
+        """Test scalar bonuses broadcast across every row."""
+        components = np.array([
+            [0, 30, 10, 0, 0, 0, 0],
+            [0, 40, 0, 0, 0, 0, 0],
+        ])
+        
+        result = calculate_fishing_speed_batch(components, flat_bonus=10, multiplier=1.2)
+        
+        assert result.tolist() == [60.0, 60.0]
+    
+    def test_batch_does_not_mutate_input(self):
+        """Test float input arrays are left untouched."""
+        components = np.array([[1.5, 2.5, 0, 0, 0, 0, 0]])
+        
+        calculate_scc_batch(components, flat_bonus=1, multiplier=2)
+        
+        assert components.tolist() == [[1.5, 2.5, 0, 0, 0, 0, 0]]
+
+
+class TestFusedCalculator:
+    """Test fused SCC + FS calculator."""
+    
+    def test_calculate_stats_matches_batch(self):
+        """Test fused totals equal the separate batch calculators."""
+        scc = np.array([[0, 4, 10, 5, 0, 3, 2], [0, 10, 5, 0, 0, 0, 0]])
+        fs = np.array([[0, 20, 15, 10, 5, 8, 2], [0, 30, 10, 0, 0, 0, 0]])
+        gear = GearStats(*(np.stack([scc[:, i], fs[:, i]], axis=1) for i in range(7)))
+        flat = np.array([5, 10])
+        mult = np.array([1.2, 1.5])
+        
+        scc_total, fs_total = calculate_stats(gear, flat, mult)
+        
+        assert scc_total.tolist() == calculate_scc_batch(scc, 5, 1.2).tolist()
+        assert fs_total.tolist() == calculate_fishing_speed_batch(fs, 10, 1.5).tolist()
@@ -0,0 +1,33 @@
+"""
+Unit tests for the orjson-backed JSON model field.
+"""
+import json
+
+import numpy as np
+from fishing.fields import OrJSONEncoder, OrJSONField
+
+
+class TestOrJSONField:
+    """Test encoding, decoding and migration state of OrJSONField."""
+
+    def test_encoder_matches_stdlib_json(self):
+        """Test output parses to the same value stdlib json produces."""
+        value = {'scc': 12.5, 'tags': ['a', 'b'], 'nested': {'level': 30}}
+        assert json.loads(json.dumps(value, cls=OrJSONEncoder)) == value
+
+    def test_encoder_handles_numpy_and_int_keys(self):
+        """Test NumPy values and non-string keys serialize like plain Python."""
+        value = {1: np.float64(2.5), 'fs': np.array([1, 2])}
+        assert json.loads(json.dumps(value, cls=OrJSONEncoder)) == {'1': 2.5, 'fs': [1, 2]}
+
+    def test_from_db_value(self):
+        """Test stored text is decoded and None passes through."""
+        field = OrJSONField()
+        assert field.from_db_value('{"a": [1, 2]}', None, None) == {'a': [1, 2]}
+        assert field.from_db_value(None, None, None) is None
+
+    def test_deconstruct_omits_default_encoder(self):
+        """Test the default encoder is not written into migrations."""
+        _, path, _, kwargs = OrJSONField(default=dict).deconstruct()
+        assert path == 'fishing.fields.OrJSONField'
+        assert 'encoder' not in kwargs
@@ -2,16 +2,32 @@
 Unit tests for Hypixel API client.
 Uses pytest-httpx to mock HTTP responses.
 """
+import asyncio
+import time
 import pytest
 import httpx
+from django.core.cache import cache
+from tenacity import stop_after_attempt, wait_none
+from fishing import hypixel_api
 from fishing.hypixel_api import (
     HypixelAPIClient,
     PlayerNotFoundError,
     RateLimitError,
-    HypixelAPIError
+    HypixelAPIError,
+    _TokenBucket,
+    close_shared_clients,
+    run_sync
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Start every test with empty UUID/profile caches."""
+    hypixel_api._uuid_cache.clear()
+    hypixel_api._profiles_cache.clear()
+    cache.clear()
+
+
 @pytest.mark.asyncio
 class TestHypixelAPIClient:
     """Test Hypixel API client."""
@@ -27,7 +43,32 @@ class TestHypixelAPIClient:
         uuid = await client.get_uuid_from_ign("Technoblade")
         
         assert uuid == "b876ec32-e396-476b-a115-8438d83c67d4"
-        await client.close()
+    
+    async def test_get_uuid_from_ign_invalid_uuid(self, httpx_mock):
+        """Test malformed UUID from Mojang raises an API error."""
+        httpx_mock.add_response(
+            url="https://api.mojang.com/users/profiles/minecraft/Broken",
+            json={"id": "not-a-uuid", "name": "Broken"}
+        )
+        
+        client = HypixelAPIClient()
+        
+        with pytest.raises(HypixelAPIError, match="invalid UUID"):
+            await client.get_uuid_from_ign("Broken")
+    
+    async def test_get_uuid_from_ign_cached(self, httpx_mock):
+        """Test repeated UUID lookups are served from cache, case-insensitively."""
+        httpx_mock.add_response(
+            url="https://api.mojang.com/users/profiles/minecraft/Technoblade",
+            json={"id": "b876ec32e396476ba1158438d83c67d4", "name": "Technoblade"}
+        )
+        
+        client = HypixelAPIClient()
+        first = await client.get_uuid_from_ign("Technoblade")
+        second = await client.get_uuid_from_ign("technoblade")
+        
+        assert first == second == "b876ec32-e396-476b-a115-8438d83c67d4"
+        assert len(httpx_mock.get_requests()) == 1
     
     async def test_get_uuid_from_ign_not_found(self, httpx_mock):
         """Test IGN not found."""
@@ -40,8 +81,6 @@ class TestHypixelAPIClient:
         
         with pytest.raises(PlayerNotFoundError, match="IGN 'NonExistentPlayer123' not found"):
             await client.get_uuid_from_ign("NonExistentPlayer123")
-        
-        await client.close()
     
     async def test_get_skyblock_profiles_success(self, httpx_mock):
         """Test successful profile fetch."""
@@ -70,7 +109,203 @@ class TestHypixelAPIClient:
         
         assert len(data['profiles']) == 1
         assert data['profiles'][0]['cute_name'] == "Apple"
-        await client.close()
+    
+    async def test_get_skyblock_profiles_concurrent_single_request(self, httpx_mock):
+        """Test concurrent lookups for one UUID share a single request."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=b876ec32e396476ba1158438d83c67d4",
+            json={"success": True, "profiles": [{"profile_id": "abc123"}]}
+        )
+        
+        client = HypixelAPIClient()
+        results = await asyncio.gather(*(
+            client.get_skyblock_profiles("b876ec32-e396-476b-a115-8438d83c67d4")
+            for _ in range(5)
+        ))
+        
+        assert all(r['profiles'][0]['profile_id'] == "abc123" for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+    
+    async def test_get_skyblock_profiles_concurrent_per_api_key(self, httpx_mock):
+        """Test concurrent lookups with different API keys are not coalesced."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa&key=good-key",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa&key=bad-key",
+            status_code=403
+        )
+        
+        good, bad = await asyncio.gather(
+            HypixelAPIClient(api_key="good-key").get_skyblock_profiles("aaa"),
+            HypixelAPIClient(api_key="bad-key").get_skyblock_profiles("aaa"),
+            return_exceptions=True
+        )
+        
+        assert good['profiles'][0]['profile_id'] == "p1"
+        assert isinstance(bad, HypixelAPIError)
+    
+    async def test_single_flight_survives_leader_cancellation(self):
+        """Test waiters re-run the fetch instead of inheriting a cancellation."""
+        calls = []
+        gate = asyncio.Event()
+        
+        async def fetch():
+            calls.append(1)
+            await gate.wait()
+            return len(calls)
+        
+        leader = asyncio.create_task(hypixel_api._single_flight("k", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hypixel_api._single_flight("k", fetch))
+        await asyncio.sleep(0)
+        
+        leader.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        
+        assert await waiter == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+    
+    async def test_get_skyblock_profiles_shared_cache(self, httpx_mock):
+        """Test profiles are served from Django's cache after a process-local miss."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        
+        client = HypixelAPIClient()
+        await client.get_skyblock_profiles("aaa")
+        hypixel_api._profiles_cache.clear()  # Simulate another worker
+        data = await client.get_skyblock_profiles("aaa")
+        
+        assert data['profiles'][0]['profile_id'] == "p1"
+        assert len(httpx_mock.get_requests()) == 1
+    
+    async def test_get_skyblock_profiles_age_spans_cache_layers(self, httpx_mock):
+        """Test a shared entry past PROFILES_CACHE_TTL is refetched, and a
+        fresh one is copied locally with its original fetch time."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa",
+            json={"success": True, "profiles": [{"profile_id": "new"}]}
+        )
+        ttl = hypixel_api.PROFILES_CACHE_TTL
+        client = HypixelAPIClient()
+        
+        stale = (time.time() - ttl - 1, {"profiles": [{"profile_id": "old"}]})
+        await cache.aset("hypixel:profiles:bbb:", (time.time() - ttl + 30, stale[1]), 300)
+        await cache.aset("hypixel:profiles:aaa:", stale, 300)
+        
+        assert (await client.get_skyblock_profiles("bbb"))['profiles'][0]['profile_id'] == "old"
+        assert hypixel_api._profiles_cache["bbb:"][0] < time.time() - ttl + 31
+        assert (await client.get_skyblock_profiles("aaa"))['profiles'][0]['profile_id'] == "new"
+        assert len(httpx_mock.get_requests()) == 1
+    
+    async def test_get_skyblock_profiles_shared_cache_down(self, httpx_mock, monkeypatch):
+        """Test a failing shared cache falls back to the API and the local cache."""
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("cache unreachable")
+        
+        monkeypatch.setattr(hypixel_api.cache, 'aget', unavailable)
+        monkeypatch.setattr(hypixel_api.cache, 'aset', unavailable)
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        
+        client = HypixelAPIClient()
+        first = await client.get_skyblock_profiles("aaa")
+        second = await client.get_skyblock_profiles("aaa")
+        
+        assert first['profiles'][0]['profile_id'] == second['profiles'][0]['profile_id'] == "p1"
+        assert len(httpx_mock.get_requests()) == 1
+    
+    async def test_get_skyblock_profiles_cache_scoped_to_api_key(self, httpx_mock):
+        """Test a cached lookup is not reused for a different API key."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa&key=good-key",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa&key=bad-key",
+            status_code=403
+        )
+        
+        await HypixelAPIClient(api_key="good-key").get_skyblock_profiles("aaa")
+        
+        with pytest.raises(HypixelAPIError, match="403"):
+            await HypixelAPIClient(api_key="bad-key").get_skyblock_profiles("aaa")
+        
+        assert len(httpx_mock.get_requests()) == 2
+    
+    async def test_get_retries_after_timeout(self, httpx_mock, monkeypatch):
+        """Test a timed-out request is retried within the retry budget."""
+        monkeypatch.setattr(HypixelAPIClient._get.retry, 'wait', wait_none())
+        httpx_mock.add_exception(
+            httpx.ReadTimeout("timed out"),
+            url="https://api.hypixel.net/player?uuid=aaa"
+        )
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/player?uuid=aaa",
+            json={"success": True, "player": {"displayname": "aaa"}}
+        )
+        
+        data = await HypixelAPIClient()._get("/player", {"uuid": "aaa"})
+        
+        assert data['player']['displayname'] == "aaa"
+        assert len(httpx_mock.get_requests()) == 2
+        assert HypixelAPIClient.TIMEOUT.read < HypixelAPIClient.RETRY_BUDGET
+    
+    async def test_get_does_not_mutate_params(self, httpx_mock):
+        """Test the API key is added to the query without touching caller params."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/player?uuid=aaa&key=test-key",
+            json={"success": True, "player": {}}
+        )
+        
+        client = HypixelAPIClient(api_key="test-key")
+        params = {"uuid": "aaa"}
+        await client._get("/player", params)
+        
+        assert params == {"uuid": "aaa"}
+    
+    async def test_get_skyblock_profiles_bulk(self, httpx_mock):
+        """Test bulk fetch returns profiles or the error for each UUID."""
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=bbb",
+            json={"success": True, "profiles": None}
+        )
+        
+        client = HypixelAPIClient()
+        results = await client.get_skyblock_profiles_bulk(["aaa", "bbb"])
+        
+        assert results["aaa"]['profiles'][0]['profile_id'] == "p1"
+        assert isinstance(results["bbb"], PlayerNotFoundError)
+    
+    async def test_get_skyblock_profiles_bulk_timeout(self, httpx_mock, monkeypatch):
+        """Test one UUID timing out does not lose the other results."""
+        monkeypatch.setattr(HypixelAPIClient._get.retry, 'wait', wait_none())
+        monkeypatch.setattr(HypixelAPIClient._get.retry, 'stop', stop_after_attempt(1))
+        httpx_mock.add_response(
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=aaa",
+            json={"success": True, "profiles": [{"profile_id": "p1"}]}
+        )
+        httpx_mock.add_exception(
+            httpx.ReadTimeout("timed out"),
+            url="https://api.hypixel.net/v2/skyblock/profiles?uuid=bbb"
+        )
+        
+        results = await HypixelAPIClient().get_skyblock_profiles_bulk(["aaa", "bbb"])
+        
+        assert results["aaa"]['profiles'][0]['profile_id'] == "p1"
+        assert isinstance(results["bbb"], HypixelAPIError)
+        assert isinstance(results["bbb"].__cause__, httpx.ReadTimeout)
     
     async def test_get_skyblock_profiles_no_profiles(self, httpx_mock):
         """Test player with no Skyblock profiles."""
@@ -83,8 +318,6 @@ class TestHypixelAPIClient:
         
         with pytest.raises(PlayerNotFoundError, match="Player has no Skyblock profiles"):
             await client.get_skyblock_profiles("test123")
-        
-        await client.close()
     
     async def test_rate_limit_error(self, httpx_mock):
         """Test 429 rate limit response."""
@@ -97,8 +330,55 @@ class TestHypixelAPIClient:
         
         with pytest.raises(RateLimitError, match="API rate limit exceeded"):
             await client.get_skyblock_profiles("test123")
+    
+    async def test_clients_share_http_client(self):
+        """Test instances reuse one pooled HTTP client per event loop."""
+        first = HypixelAPIClient()
+        second = HypixelAPIClient(api_key="test-key")
+        
+        assert first.client is second.client
+    
+    async def test_close_is_deprecated_noop(self):
+        """Test close() warns and leaves the shared client open for other requests."""
+        client = HypixelAPIClient()
         
-        await client.close()
+        with pytest.warns(DeprecationWarning):
+            await client.close()
+        
+        assert not HypixelAPIClient().client.is_closed
+
+
+class TestRunSync:
+    """Test running lookups on the shared background loop."""
+    
+    @staticmethod
+    async def current_client():
+        return HypixelAPIClient().client
+    
+    def test_run_sync_reuses_client_across_calls(self):
+        """Test separate sync calls share one open HTTP client."""
+        first = run_sync(self.current_client())
+        second = run_sync(self.current_client())
+        
+        assert first is second
+        assert not first.is_closed
+    
+    def test_run_sync_reraises(self):
+        """Test errors from the coroutine reach the caller."""
+        async def fail():
+            raise PlayerNotFoundError("gone")
+        
+        with pytest.raises(PlayerNotFoundError, match="gone"):
+            run_sync(fail())
+    
+    def test_close_shared_clients_closes_background_client(self):
+        """Test the exit hook closes the client on the running background loop."""
+        client = run_sync(self.current_client())
+        
+        close_shared_clients()
+        
+        assert client.is_closed
+        assert run_sync(self.current_client()) is not client
 
 
 class TestFishingStatsExtraction:
@@ -162,3 +442,55 @@ class TestFishingStatsExtraction:
         
         assert stats['fishing_level'] == 20
         assert stats['fishing_xp'] == 572625
+    
+    def test_extract_fishing_stats_missing_member(self):
+        """Test extraction when the UUID is not a member of the profile."""
+        profile = {
+            "profile_id": "abc123",
+            "cute_name": "Apple",
+            "members": {}
+        }
+        
+        client = HypixelAPIClient()
+        stats = client.extract_fishing_stats(profile, "test-uuid")
+        
+        assert stats['fishing_xp'] == 0
+        assert stats['trophy_fish'] == {}
+        assert stats['sea_creature_kills'] == {}
+        assert stats['profile_id'] == "abc123"
+
+
+class TestXPToLevel:
+    """Test fishing XP to level conversion."""
+    
+    def test_xp_to_level_class_and_instance(self):
+        """Test level lookup works from both the class and an instance."""
+        client = HypixelAPIClient()
+        
+        for xp in (0, 49, 50, 175, 572625, 1332625):
+            assert HypixelAPIClient._xp_to_level(xp) == client._xp_to_level(xp)
+    
+    def test_xp_to_level_thresholds(self):
+        """Test level boundaries sit exactly on the cumulative thresholds."""
+        assert HypixelAPIClient._xp_to_level(49) == 1
+        assert HypixelAPIClient._xp_to_level(50) == 2
+        assert HypixelAPIClient._xp_to_level(174) == 2
+        assert HypixelAPIClient._xp_to_level(175) == 3
+    
+    def test_xp_to_level_max(self):
+        """Test level is capped at 50."""
+        total = sum(HypixelAPIClient.FISHING_XP_THRESHOLDS)
+        assert HypixelAPIClient._xp_to_level(total) == 50
+        assert HypixelAPIClient._xp_to_level(total * 10) == 50
+
+
+class TestTokenBucket:
+    """Test the request rate limiter."""
+    
+    def test_burst_then_wait(self):
+        """Test a full bucket allows a burst, then asks callers to wait."""
+        bucket = _TokenBucket(3, 60)
+        
+        assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket._reserve() == pytest.approx(20.0, abs=0.1)
+        assert bucket._reserve() == pytest.approx(40.0, abs=0.1)
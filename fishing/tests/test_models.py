@@ -0,0 +1,84 @@
+"""
+Unit tests for model helpers that need no database.
+"""
+import uuid
+
+from fishing import models
+from fishing.models import Player, ProfileSnapshot, uuid7
+
+
+class TestSnapshotRawJSON:
+    """Test the compressed raw_json property."""
+    
+    def test_constructor_round_trip(self):
+        """Test raw_json passed to the constructor is compressed and readable."""
+        payload = {"profiles": [{"profile_id": "abc", "members": {"u": {"xp": 1.5}}}]}
+        snapshot = ProfileSnapshot(player=Player(ign="Steve"), raw_json=payload)
+        
+        assert snapshot.raw_json_zstd[:4] == b"\x28\xb5\x2f\xfd"  # zstd frame magic
+        assert snapshot.raw_json == payload
+        assert ProfileSnapshot(raw_json_zstd=snapshot.raw_json_zstd).raw_json == payload
+    
+    def test_setter_round_trip(self):
+        """Test assigning raw_json replaces both the column and the decoded value."""
+        snapshot = ProfileSnapshot(raw_json={"a": 1})
+        snapshot.raw_json = {"b": [1, 2]}
+        
+        assert snapshot.raw_json == {"b": [1, 2]}
+        assert ProfileSnapshot(raw_json_zstd=snapshot.raw_json_zstd).raw_json == {"b": [1, 2]}
+    
+    def test_direct_column_assignment_invalidates_memo(self):
+        """Test replacing raw_json_zstd (as refresh_from_db does) is not masked by the memo."""
+        snapshot = ProfileSnapshot(raw_json={"a": 1})
+        assert snapshot.raw_json == {"a": 1}
+        
+        snapshot.raw_json_zstd = ProfileSnapshot(raw_json={"b": 2}).raw_json_zstd
+        
+        assert snapshot.raw_json == {"b": 2}
+    
+    def test_empty_column(self):
+        """Test a snapshot without a stored response reads as an empty dict."""
+        assert ProfileSnapshot().raw_json == {}
+
+
+class TestSnapshotQuerySet:
+    """Test snapshot eager loading stays opt-in."""
+    
+    def test_only_without_player(self):
+        """Test deferred queries that skip player still compile."""
+        sql = str(ProfileSnapshot.objects.only('id', 'skill_fishing_level').query)
+        
+        assert 'fishing_player' not in sql
+    
+    def test_with_player_joins(self):
+        """Test with_player() joins the player table."""
+        assert 'fishing_player' in str(ProfileSnapshot.objects.with_player().query)
+
+
+class TestUUID7:
+    """Test the time-ordered primary key generator."""
+    
+    def test_version_and_variant(self):
+        """Test IDs carry version 7 and the RFC variant bits."""
+        value = uuid7()
+        
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+    
+    def test_timestamp_prefix(self):
+        """Test the top 48 bits hold the Unix time in milliseconds."""
+        value = uuid7()
+        
+        assert abs((value.int >> 80) - models.time.time_ns() // 1_000_000) < 1000
+    
+    def test_ordered_by_millisecond(self, monkeypatch):
+        """Test IDs from later milliseconds sort after earlier ones."""
+        ids = []
+        times = (1_700_000_000_000, 1_700_000_000_001, 1_700_000_000_002)
+        for ms in times:
+            monkeypatch.setattr(models.time, 'time_ns', lambda ms=ms: ms * 1_000_000)
+            ids.extend(uuid7() for _ in range(20))
+        
+        assert [value.int >> 80 for value in ids] == [ms for ms in times for _ in range(20)]
+        assert max(ids[:20]) < min(ids[20:40]) and max(ids[20:40]) < min(ids[40:])
+        assert len(set(ids)) == 60
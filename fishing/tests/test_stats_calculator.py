@@ -0,0 +1,149 @@
+"""
+Unit tests for the advanced fishing stats calculator.
+"""
+import pytest
+from fishing.stats_calculator import (
+    FishingStatsCalculator,
+    calculate_all_stats,
+    clear_stats_cache
+)
+
+
+@pytest.fixture
+def calculator():
+    return FishingStatsCalculator({"members": {}}, "test-uuid")
+
+
+class TestTrophyFishStats:
+    """Test trophy fish aggregation."""
+    
+    def test_trophy_fish_by_tier_and_fish(self, calculator):
+        """Test counts are grouped by tier and by fish."""
+        stats = calculator.calculate_trophy_fish_stats({
+            "sulphur_skitter_bronze": 10,
+            "sulphur_skitter_diamond": 2,
+            "golden_fish_gold": 3,
+            "mana_ray_silver": 4.0,
+        })
+        
+        assert stats['total_caught'] == 19
+        assert stats['by_tier'] == {'bronze': 10, 'silver': 4, 'gold': 3, 'diamond': 2}
+        assert stats['by_fish']['sulphur_skitter'] == {
+            'total': 12,
+            'tiers': {'bronze': 10, 'diamond': 2}
+        }
+        assert stats['by_fish']['mana_ray'] == {'total': 4, 'tiers': {'silver': 4}}
+    
+    def test_trophy_fish_skips_untiered_and_non_numeric(self, calculator):
+        """Test totals, untiered keys and non-numeric values are ignored."""
+        stats = calculator.calculate_trophy_fish_stats({
+            "sulphur_skitter": 12,
+            "total_caught": 12,
+            "last_caught": "sulphur_skitter/bronze",
+            "rewards": [1, 2],
+            "sulphur_skitter_bronze": 12,
+        })
+        
+        assert stats['total_caught'] == 12
+        assert stats['by_tier'] == {'bronze': 12, 'silver': 0, 'gold': 0, 'diamond': 0}
+        assert list(stats['by_fish']) == ['sulphur_skitter']
+    
+    def test_trophy_fish_empty(self, calculator):
+        """Test empty input yields zeroed stats of plain ints."""
+        stats = calculator.calculate_trophy_fish_stats({})
+        
+        assert stats == {
+            'total_caught': 0,
+            'by_tier': {'bronze': 0, 'silver': 0, 'gold': 0, 'diamond': 0},
+            'by_fish': {}
+        }
+        assert type(stats['total_caught']) is int
+
+
+class TestSeaCreatureStats:
+    """Test sea creature kill aggregation."""
+    
+    def test_sea_creature_totals_and_notable(self, calculator):
+        """Test totals skip non-numeric values and notable keep display order."""
+        stats = calculator.calculate_sea_creature_stats({
+            "yeti": 2,
+            "sea_walker": 100,
+            "thunder": 3.0,
+            "last_killed_mob": "yeti",
+        })
+        
+        assert stats['total_kills'] == 105
+        assert stats['unique_types'] == 3
+        assert list(stats['notable'].items()) == [('Thunder', 3), ('Yeti', 2)]
+
+
+class TestRecommendations:
+    """Test recommendation thresholds."""
+    
+    @staticmethod
+    def recs(level, total=0, diamond=0):
+        trophy_stats = {'total_caught': total, 'by_tier': {'diamond': diamond}}
+        return FishingStatsCalculator.get_fishing_recommendations(level, 0.0, trophy_stats)
+    
+    def test_level_messages(self):
+        """Test level bands, including the overlapping 26-29 band."""
+        assert len(self.recs(24)) == 3
+        assert self.recs(25)[0].startswith("🏆")
+        assert self.recs(26)[:2] == (
+            "🏆 Start trophy fishing in the Crimson Isle for better loot",
+            "✅ You can fish for Great White Sharks and Thunder",
+        )
+        assert self.recs(30)[0].startswith("✅")
+        assert self.recs(40)[1].startswith("🌊")
+    
+    def test_trophy_and_diamond_messages(self):
+        """Test trophy totals and diamond counts pick the right message."""
+        assert self.recs(30, total=0)[-2:] == (
+            "🐠 Start trophy fishing to improve your Fishing Speed and earn rewards!",
+            "💎 You need more diamond trophy fish (current: 0)",
+        )
+        assert self.recs(30, total=5)[-1] == "💎 Try to catch your first diamond trophy fish!"
+        assert self.recs(30, total=1000, diamond=10)[-2:] == (
+            "🌟 Impressive! You've caught 1000 trophy fish!",
+            "💎 Good progress on diamond trophies! (10/50)",
+        )
+        assert self.recs(30, total=2000, diamond=50)[-1] == "🌟 Outstanding! You have 50 diamond trophy fish"
+
+
+class TestAllStats:
+    """Test combined stats calculation."""
+    
+    def test_all_stats_memoized_on_content(self, calculator):
+        """Test equal inputs reuse the cached result regardless of key order."""
+        clear_stats_cache()
+        first = calculator.calculate_all_stats(
+            30, 1000.0,
+            {"gusher_bronze": 5, "gusher_gold": 1, "rewards": [1]},
+            {"thunder": 3, "yeti": 1}
+        )
+        second = calculator.calculate_all_stats(
+            30, 1000.0,
+            {"gusher_gold": 1, "gusher_bronze": 5},
+            {"yeti": 1, "thunder": 3}
+        )
+        
+        assert second is first
+        assert first['trophy_fish']['total_caught'] == 6
+        assert first['sea_creatures']['notable'] == {'Thunder': 3, 'Yeti': 1}
+    
+    def test_clear_stats_cache(self, calculator):
+        """Test clearing the cache forces recomputation."""
+        first = calculator.calculate_all_stats(10, 0.0, {}, {})
+        clear_stats_cache()
+        second = calculator.calculate_all_stats(10, 0.0, {}, {})
+        
+        assert second is not first
+        assert second == first
+    
+    def test_class_delegates_to_module_function(self, calculator):
+        """Test the backwards-compatible class shares the module-level cache."""
+        clear_stats_cache()
+        
+        result = calculate_all_stats(20, 0.0, {"gusher_bronze": 1}, {})
+        
+        assert calculator.calculate_all_stats(20, 0.0, {"gusher_bronze": 1}, {}) is result
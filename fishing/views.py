@@ -1,29 +1,41 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.http import require_GET, require_POST
 from django.shortcuts import render
+from django.template.loader import render_to_string
 from django.views.decorators.csrf import csrf_exempt
-from .hypixel_api import HypixelAPIClient, PlayerNotFoundError, RateLimitError, HypixelAPIError
+from .hypixel_api import HypixelAPIClient, PlayerNotFoundError, RateLimitError, HypixelAPIError, run_sync
 from .models import Player, ProfileSnapshot
-from .stats_calculator import FishingStatsCalculator
-import asyncio
+from .stats_calculator import calculate_all_stats
+from functools import cache
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Static health payload, serialized once
+_HEALTH_JSON = orjson.dumps({
+    "status": "ok",
+    "service": "skyskills-fishing",
+    "version": "0.1.0"
+})
+
 
 @require_GET
 def health_check(request):
     """Health check endpoint for monitoring."""
-    return JsonResponse({
-        "status": "ok",
-        "service": "skyskills-fishing",
-        "version": "0.1.0"
-    })
+    return HttpResponse(_HEALTH_JSON, content_type='application/json')
+
+
+@cache
+def _home_html():
+    # home.html uses no request context (no csrf_token, no user), so the
+    # page is rendered on first use and then served as-is
+    return render_to_string('home.html')
 
 
 def home(request):
     """Homepage with IGN input form."""
-    return render(request, 'home.html')
+    return HttpResponse(_home_html())
 
 
 @csrf_exempt
@@ -50,7 +62,7 @@ def player_lookup(request):
         })
     
     try:
-        result = asyncio.run(fetch_all_profiles(ign, api_key))
+        result = run_sync(fetch_all_profiles(ign, api_key))
         
         logger.info(f"Successfully fetched {len(result['profiles'])} profiles for {ign}")
         
@@ -107,7 +119,7 @@ def profile_detail(request, uuid, profile_id):
         })
     
     try:
-        result = asyncio.run(fetch_profile_detail(uuid, profile_id, api_key))
+        result = run_sync(fetch_profile_detail(uuid, profile_id, api_key))
         
         logger.info(f"Successfully fetched profile {profile_id} for UUID {uuid}")
         
@@ -158,38 +170,34 @@ async def fetch_all_profiles(ign: str, api_key: str):
     """
     client = HypixelAPIClient(api_key=api_key)
     
-    try:
-        # Get UUID
-        uuid = await client.get_uuid_from_ign(ign)
-        
-        # Get all profiles
-        profiles_data = await client.get_skyblock_profiles(uuid)
-        profiles = profiles_data['profiles']
-        
-        # Extract basic stats for each profile
-        profile_list = []
-        for profile in profiles:
-            stats = client.extract_fishing_stats(profile, uuid)
-            profile_list.append({
-                'profile_id': stats['profile_id'],
-                'cute_name': stats['cute_name'],
-                'fishing_level': stats['fishing_level'],
-                'fishing_xp': stats['fishing_xp'],
-                'trophy_fish_count': len(stats['trophy_fish']),
-                'sea_creatures_count': len(stats['sea_creature_kills'])
-            })
-        
-        # Sort by fishing level (descending)
-        profile_list.sort(key=lambda x: x['fishing_xp'], reverse=True)
-        
-        return {
-            'ign': ign,
-            'uuid': uuid,
-            'profiles': profile_list
-        }
+    # Get UUID
+    uuid = await client.get_uuid_from_ign(ign)
+    
+    # Get all profiles
+    profiles_data = await client.get_skyblock_profiles(uuid)
+    profiles = profiles_data['profiles']
     
-    finally:
-        await client.close()
+    # Extract basic stats for each profile
+    profile_list = []
+    for profile in profiles:
+        stats = client.extract_fishing_stats(profile, uuid)
+        profile_list.append({
+            'profile_id': stats['profile_id'],
+            'cute_name': stats['cute_name'],
+            'fishing_level': stats['fishing_level'],
+            'fishing_xp': stats['fishing_xp'],
+            'trophy_fish_count': len(stats['trophy_fish']),
+            'sea_creatures_count': len(stats['sea_creature_kills'])
+        })
+    
+    # Sort by fishing level (descending)
+    profile_list.sort(key=lambda x: x['fishing_xp'], reverse=True)
+    
+    return {
+        'ign': ign,
+        'uuid': uuid,
+        'profiles': profile_list
+    }
 
 
 async def fetch_profile_detail(uuid: str, profile_id: str, api_key: str):
@@ -198,45 +206,40 @@ async def fetch_profile_detail(uuid: str, profile_id: str, api_key: str):
     """
     client = HypixelAPIClient(api_key=api_key)
     
-    try:
-        # Get profiles
-        profiles_data = await client.get_skyblock_profiles(uuid)
-        
-        # Find the specific profile
-        profile = next((p for p in profiles_data['profiles'] if p['profile_id'] == profile_id), None)
-        
-        if not profile:
-            raise PlayerNotFoundError(f"Profile {profile_id} not found")
-        
-        # Extract detailed stats
-        stats = client.extract_fishing_stats(profile, uuid)
-        
-        # Calculate advanced stats
-        calculator = FishingStatsCalculator(profile, uuid)
-        advanced_stats = calculator.calculate_all_stats(
-            stats['fishing_level'],
-            stats['fishing_xp'],
-            stats['trophy_fish'],
-            stats['sea_creature_kills']
-        )
-        
-        # Get IGN from Mojang API
-        uuid_clean = uuid.replace('-', '')
-        response = await client.client.get(f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid_clean}")
-        ign = response.json().get('name', 'Unknown')
-        
-        return {
-            'ign': ign,
-            'uuid': uuid,
-            'profile_id': stats['profile_id'],
-            'profile_name': stats['cute_name'],
-            'fishing_level': stats['fishing_level'],
-            'fishing_xp': stats['fishing_xp'],
-            'trophy_fish': stats['trophy_fish'],
-            'sea_creature_kills': stats['sea_creature_kills'],
-            'raw_profile': profile,
-            'advanced_stats': advanced_stats
-        }
-    
-    finally:
-        await client.close()
+    # Get profiles
+    profiles_data = await client.get_skyblock_profiles(uuid)
+    
+    # Find the specific profile
+    profile = next((p for p in profiles_data['profiles'] if p['profile_id'] == profile_id), None)
+    
+    if not profile:
+        raise PlayerNotFoundError(f"Profile {profile_id} not found")
+    
+    # Extract detailed stats
+    stats = client.extract_fishing_stats(profile, uuid)
+    
+    # Calculate advanced stats
+    advanced_stats = calculate_all_stats(
+        stats['fishing_level'],
+        stats['fishing_xp'],
+        stats['trophy_fish'],
+        stats['sea_creature_kills']
+    )
+    
+    # Get IGN from Mojang API
+    uuid_clean = uuid.replace('-', '')
+    response = await client.client.get(f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid_clean}")
+    ign = orjson.loads(response.content).get('name', 'Unknown')
+    
+    return {
+        'ign': ign,
+        'uuid': uuid,
+        'profile_id': stats['profile_id'],
+        'profile_name': stats['cute_name'],
+        'fishing_level': stats['fishing_level'],
+        'fishing_xp': stats['fishing_xp'],
+        'trophy_fish': stats['trophy_fish'],
+        'sea_creature_kills': stats['sea_creature_kills'],
+        'raw_profile': profile,
+        'advanced_stats': advanced_stats
+    }